@@ -26,6 +26,7 @@ from .vst import (
     pivot_agb_by_allometry,
     merge_agb_with_apparent_individual,
     extract_year_from_event_id,
+    extract_years_from_event_ids,
     get_unique_plot_years,
     get_plot_years_from_perplotperyear,
     # Gap filling
@@ -38,6 +39,7 @@ from .vst import (
     forward_fill_growth_form,
     # Biomass calculation
     categorize_individual,
+    categorize_arrays,
     add_category_column,
     calculate_tree_biomass_density,
     calculate_small_woody_biomass_density,
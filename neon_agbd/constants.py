@@ -2,8 +2,11 @@
 Constants used across the neon-agbd codebase.
 """
 
-# Plant status values that indicate the tree is dead (biomass = 0)
-DEAD_STATUSES = {
+import pandas as pd
+
+# Plant status values that indicate the tree is dead (biomass = 0).
+# Frozensets: O(1) membership, hashable, and immune to accidental mutation.
+DEAD_STATUSES = frozenset({
     'Dead, broken bole',
     'Downed',
     'Lost, burned',
@@ -11,17 +14,17 @@ DEAD_STATUSES = {
     'Lost, herbivory',
     'Lost, presumed dead',
     'Standing dead',
-}
+})
 
 # Plant status values that indicate administrative removal from plot
 # Trees with these statuses have biomass set to NaN (not 0) for all years
-REMOVED_STATUSES = {
+REMOVED_STATUSES = frozenset({
     'Removed',
     'No longer qualifies',
-}
+})
 
 # Plant status values that indicate the tree is alive
-LIVE_STATUSES = {
+LIVE_STATUSES = frozenset({
     '',
     'Live',
     'Live,  other damage',
@@ -30,11 +33,11 @@ LIVE_STATUSES = {
     'Live, insect damaged',
     'Live, physically damaged',
     'Lost, tag damaged',
-}
+})
 
-# Constants for categorizing growth forms
-TREE_GROWTH_FORMS = ['single bole tree', 'multi-bole tree', 'small tree']
-SMALL_WOODY_GROWTH_FORMS = ['small tree', 'sapling', 'single shrub', 'small shrub']
+# Constants for categorizing growth forms (frozensets for O(1) membership)
+TREE_GROWTH_FORMS = frozenset({'single bole tree', 'multi-bole tree', 'small tree'})
+SMALL_WOODY_GROWTH_FORMS = frozenset({'small tree', 'sapling', 'single shrub', 'small shrub'})
 
 # Diameter threshold (cm) for separating trees from small woody
 DIAMETER_THRESHOLD = 10.0
@@ -42,6 +45,18 @@ DIAMETER_THRESHOLD = 10.0
 # Allometry column names
 ALLOMETRY_COLS = ['AGBJenkins', 'AGBChojnacky', 'AGBAnnighofer']
 
+# Fixed dtype for the 'category' column. The category order matches the int8
+# codes produced by categorize_arrays (0=other, 1=tree, 2=small_woody), so
+# codes are stable across frames and groupbys never see unexpected categories.
+CATEGORY_DTYPE = pd.CategoricalDtype(['other', 'tree', 'small_woody'])
+
+# Fixed dtype for the 'gapFilling' provenance column created during grid
+# construction; includes every value later written into it so masked
+# assignments never have to grow the categories.
+GAP_FILLING_DTYPE = pd.CategoricalDtype(
+    ['ORIGINAL', 'FILLED', 'OUTLIER', 'REMOVED', 'NOT_QUALIFIED']
+)
+
 # Unit conversion: NEONForestAGB provides AGB in kg, we convert to Mg (tonnes)
 # 1 Mg = 1000 kg, so Mg/ha = kg/ha / 1000
 KG_TO_MG = 1 / 1000.0
@@ -13,6 +13,7 @@ from .data_loader import (
     pivot_agb_by_allometry,
     merge_agb_with_apparent_individual,
     extract_year_from_event_id,
+    extract_years_from_event_ids,
     get_unique_plot_years,
     get_plot_years_from_perplotperyear,
 )
@@ -29,6 +30,7 @@ from .gap_filling import (
 
 from .biomass_calculator import (
     categorize_individual,
+    categorize_arrays,
     add_category_column,
     calculate_tree_biomass_density,
     calculate_small_woody_biomass_density,
@@ -11,6 +11,7 @@ from ..constants import (
     SMALL_WOODY_GROWTH_FORMS,
     DIAMETER_THRESHOLD,
     ALLOMETRY_COLS,
+    CATEGORY_DTYPE,
     KG_TO_MG,
 )
 
@@ -57,10 +58,60 @@ def categorize_individual(row: pd.Series) -> str:
         return 'other'
 
 
+
+# Labels corresponding to the int8 codes returned by categorize_arrays
+# (same order as CATEGORY_DTYPE.categories)
+CATEGORY_LABELS = np.array(['other', 'tree', 'small_woody'], dtype=object)
+
+
+def categorize_arrays(growth_form: np.ndarray, stem_diameter: np.ndarray) -> np.ndarray:
+    """
+    Categorize individuals from raw arrays (SoA layout).
+
+    Applies the same rules as categorize_individual, but on whole columns at
+    once - no per-row Series construction or dict lookups.
+
+    Parameters
+    ----------
+    growth_form : np.ndarray
+        Array of growthForm strings (may contain NaN/empty)
+    stem_diameter : np.ndarray
+        Array of stem diameters in cm (may contain NaN)
+
+    Returns
+    -------
+    np.ndarray
+        int8 category codes: 0=other, 1=tree, 2=small_woody
+        (index into CATEGORY_LABELS)
+    """
+    growth_form = np.asarray(growth_form, dtype=object)
+    stem_diameter = np.asarray(stem_diameter, dtype=np.float64)
+
+    has_growth_form = pd.notna(growth_form) & (growth_form != '')
+    is_tree = (
+        has_growth_form
+        & np.isin(growth_form, list(TREE_GROWTH_FORMS))
+        & (stem_diameter >= DIAMETER_THRESHOLD)
+    )
+    is_small_woody = (
+        has_growth_form
+        & np.isin(growth_form, list(SMALL_WOODY_GROWTH_FORMS))
+        & ((stem_diameter < DIAMETER_THRESHOLD) | np.isnan(stem_diameter))
+    )
+
+    codes = np.zeros(len(growth_form), dtype=np.int8)
+    codes[is_small_woody] = 2
+    codes[is_tree] = 1  # tree takes precedence where both masks hit
+    return codes
+
+
 def add_category_column(df: pd.DataFrame) -> pd.DataFrame:
     """
     Add a 'category' column to the dataframe based on growth form and diameter.
 
+    Applies the same rules as categorize_individual via the vectorized
+    categorize_arrays kernel instead of a per-row apply.
+
     Parameters
     ----------
     df : pd.DataFrame
@@ -69,11 +120,24 @@ def add_category_column(df: pd.DataFrame) -> pd.DataFrame:
     Returns
     -------
     pd.DataFrame
-        DataFrame with added 'category' column
+        DataFrame with added 'category' column. Under copy-on-write this
+        shares the input's column blocks rather than deep-copying them.
     """
-    df = df.copy()
-    df['category'] = df.apply(categorize_individual, axis=1)
-    return df
+    if 'growthForm' in df.columns:
+        growth_form = df['growthForm']
+    else:
+        growth_form = pd.Series('', index=df.index)
+    if 'stemDiameter' in df.columns:
+        stem_diameter = df['stemDiameter']
+    else:
+        stem_diameter = pd.Series(np.nan, index=df.index)
+
+    codes = categorize_arrays(growth_form.to_numpy(), stem_diameter.to_numpy())
+    # The codes index CATEGORY_DTYPE.categories directly, so the categorical
+    # column is built without re-hashing any strings
+    return df.assign(
+        category=pd.Categorical.from_codes(codes, dtype=CATEGORY_DTYPE)
+    )
 
 
 def calculate_tree_biomass_density(
@@ -106,8 +170,14 @@ def calculate_tree_biomass_density(
         Dictionary with keys for each allometry type containing the
         biomass density in Mg/ha (tonnes per hectare)
     """
-    # Convert sampled area to hectares
+    # Convert sampled area to hectares; fold the validity guard and the
+    # kg->Mg conversion into one scale factor instead of re-checking and
+    # re-dividing per allometry column
     sampled_area_ha = sampled_area_m2 / 10000.0 if not pd.isna(sampled_area_m2) else np.nan
+    if pd.isna(sampled_area_ha) or sampled_area_ha <= 0:
+        density_scale = np.nan
+    else:
+        density_scale = KG_TO_MG / sampled_area_ha
 
     # Filter to the specified year
     year_df = trees_df[trees_df['year'] == year]
@@ -129,15 +199,14 @@ def calculate_tree_biomass_density(
             elif len(live_trees) > 0 and live_trees[col].isna().all():
                 # Live trees exist but ALL have NaN biomass - can't estimate
                 result[f'tree_{col}'] = np.nan
-            elif pd.isna(sampled_area_ha) or sampled_area_ha <= 0:
+            elif np.isnan(density_scale):
                 # No valid sampled area - can't calculate density
                 result[f'tree_{col}'] = np.nan
             else:
                 # Either no live trees (only dead with 0), or some live trees have valid biomass
                 # Sum all valid values (0 for dead, actual values for live with estimates)
                 total_biomass_kg = year_df[col].sum(skipna=True)
-                biomass_density_kg_ha = total_biomass_kg / sampled_area_ha
-                result[f'tree_{col}'] = biomass_density_kg_ha * KG_TO_MG
+                result[f'tree_{col}'] = total_biomass_kg * density_scale
         else:
             result[f'tree_{col}'] = np.nan
 
@@ -189,8 +258,13 @@ def calculate_small_woody_biomass_density(
         Dictionary with keys for each allometry type containing the
         biomass density in Mg/ha (tonnes per hectare)
     """
-    # Convert sampled area to hectares
+    # Convert sampled area to hectares, folding the validity guard and the
+    # kg->Mg conversion into one scale factor up front
     sampled_area_ha = sampled_area_m2 / 10000.0 if not pd.isna(sampled_area_m2) else np.nan
+    if pd.isna(sampled_area_ha) or sampled_area_ha <= 0:
+        density_scale = np.nan
+    else:
+        density_scale = KG_TO_MG / sampled_area_ha
 
     # Filter to the specified year
     year_df = small_woody_df[small_woody_df['year'] == year]
@@ -206,14 +280,10 @@ def calculate_small_woody_biomass_density(
             n_measured = len(measured_df)
 
             if n_measured > 0:
-                # Sum biomass of all measured individuals
+                # Sum biomass of all measured individuals and convert to
+                # density in Mg/ha (NaN scale covers the invalid-area case)
                 total_biomass_kg = measured_df[col].sum()
-                # Convert to density in Mg/ha (tonnes/ha)
-                if sampled_area_ha > 0 and not np.isnan(sampled_area_ha):
-                    biomass_density_kg_ha = total_biomass_kg / sampled_area_ha
-                    result[f'small_woody_{col}'] = biomass_density_kg_ha * KG_TO_MG
-                else:
-                    result[f'small_woody_{col}'] = np.nan
+                result[f'small_woody_{col}'] = total_biomass_kg * density_scale
             else:
                 # No measured individuals
                 result[f'small_woody_{col}'] = 0.0 if n_total == 0 else np.nan
@@ -222,9 +292,14 @@ def calculate_small_woody_biomass_density(
 
     # Count statistics
     result['n_small_woody_total'] = n_total
-    # Count measured (those with at least one allometry value)
-    has_measurement = year_df[ALLOMETRY_COLS].notna().any(axis=1)
-    result['n_small_woody_measured'] = has_measurement.sum()
+    # Count measured (those with at least one allometry value). OR the three
+    # column masks directly rather than materializing an Nx3 boolean frame
+    # just to reduce it.
+    has_measurement = np.zeros(len(year_df), dtype=bool)
+    for col in ALLOMETRY_COLS:
+        if col in year_df.columns:
+            has_measurement |= year_df[col].notna().to_numpy()
+    result['n_small_woody_measured'] = int(has_measurement.sum())
 
     return result
 
@@ -293,7 +368,7 @@ def aggregate_plot_biomass_all_years(
     plot_id: str,
     tree_sampled_areas: Dict[int, float],
     small_woody_sampled_areas: Dict[int, float]
-) -> pd.DataFrame:
+) -> List[Dict]:
     """
     Calculate biomass metrics for a plot across all sampled years.
 
@@ -317,20 +392,151 @@ def aggregate_plot_biomass_all_years(
 
     Returns
     -------
-    pd.DataFrame
-        DataFrame with one row per year, containing all biomass metrics
+    List[Dict]
+        One record dict per year, containing all biomass metrics. The caller
+        accumulates records across plots and builds the final DataFrame once,
+        avoiding thousands of tiny per-plot frames feeding pd.concat.
+
+    Notes
+    -----
+    Produces the same values as calling calculate_plot_year_biomass per year,
+    but computes all per-year aggregates (sums, counts, valid-value counts)
+    in single groupby passes instead of re-filtering the plot data for every
+    year.
     """
+    # Split by category once for the whole plot (the per-year aggregates
+    # below are grouped, so no per-year re-filtering happens); materialize
+    # the column a single time and derive both masks from it
+    category = plot_df['category'].to_numpy()
+    trees_df = plot_df[category == 'tree']
+    small_woody_df = plot_df[category == 'small_woody']
+
+    allometry_present = [c for c in ALLOMETRY_COLS if c in plot_df.columns]
+
+    # --- Per-year tree aggregates, one pass over trees_df ---
+    tree_grp = trees_df.groupby('year')
+    tree_n = tree_grp.size()
+    tree_sums = tree_grp[allometry_present].sum() if allometry_present else None
+
+    # Live trees (not dead) drive the "all-NaN biomass" check
+    if 'corrected_is_dead' in trees_df.columns:
+        live_trees = trees_df[trees_df['corrected_is_dead'] == False]
+    else:
+        live_trees = trees_df
+    live_grp = live_trees.groupby('year')
+    live_n = live_grp.size()
+    live_valid = live_grp[allometry_present].count() if allometry_present else None
+
+    if 'gapFilling' in trees_df.columns:
+        gap_counts = pd.DataFrame({
+            'n_filled': trees_df['gapFilling'] == 'FILLED',
+            'n_removed': trees_df['gapFilling'] == 'REMOVED',
+            'n_not_qualified': trees_df['gapFilling'] == 'NOT_QUALIFIED',
+        }).groupby(trees_df['year']).sum()
+    else:
+        gap_counts = None
+
+    # --- Per-year small woody aggregates ---
+    sw_grp = small_woody_df.groupby('year')
+    sw_n = sw_grp.size()
+    sw_sums = sw_grp[allometry_present].sum() if allometry_present else None
+    sw_valid = sw_grp[allometry_present].count() if allometry_present else None
+    if allometry_present:
+        # OR the per-column masks directly instead of building an Nx3
+        # boolean frame and reducing it row-wise
+        measured_mask = np.zeros(len(small_woody_df), dtype=bool)
+        for col in allometry_present:
+            measured_mask |= small_woody_df[col].notna().to_numpy()
+        sw_measured = (
+            pd.Series(measured_mask, index=small_woody_df.index)
+            .groupby(small_woody_df['year']).sum()
+        )
+    else:
+        sw_measured = None
+
+    # Flatten the grouped aggregates to plain dicts once: the assembly loop
+    # below does a handful of lookups per year per allometry, and dict
+    # access avoids pandas .loc indexing overhead on every one of them
+    tree_n = tree_n.to_dict()
+    live_n = live_n.to_dict()
+    sw_n = sw_n.to_dict()
+    tree_sums = tree_sums.to_dict() if tree_sums is not None else None
+    live_valid = live_valid.to_dict() if live_valid is not None else None
+    sw_sums = sw_sums.to_dict() if sw_sums is not None else None
+    sw_valid = sw_valid.to_dict() if sw_valid is not None else None
+    gap_counts = gap_counts.to_dict() if gap_counts is not None else None
+    sw_measured = sw_measured.to_dict() if sw_measured is not None else None
+
     results = []
     for year in years:
         # Get year-specific sampled areas (use NaN if not available)
         tree_area = tree_sampled_areas.get(year, np.nan)
         sw_area = small_woody_sampled_areas.get(year, np.nan)
 
-        year_result = calculate_plot_year_biomass(
-            plot_df, year, site_id, plot_id,
-            tree_sampled_area_m2=tree_area,
-            small_woody_sampled_area_m2=sw_area
+        # Fold area validity and kg->Mg conversion into one scale factor per
+        # vegetation type, checked once per year instead of per column
+        tree_area_ha = tree_area / 10000.0 if not pd.isna(tree_area) else np.nan
+        tree_scale = KG_TO_MG / tree_area_ha if tree_area_ha > 0 else np.nan
+        sw_area_ha = sw_area / 10000.0 if not pd.isna(sw_area) else np.nan
+        sw_scale = KG_TO_MG / sw_area_ha if sw_area_ha > 0 else np.nan
+
+        record = {
+            'siteID': site_id,
+            'plotID': plot_id,
+            'year': year,
+            'totalSampledAreaTrees_m2': tree_area,
+            'totalSampledAreaShrubSapling_m2': sw_area,
+        }
+
+        # Tree biomass densities
+        n_trees = int(tree_n.get(year, 0))
+        n_live = int(live_n.get(year, 0))
+        for col in ALLOMETRY_COLS:
+            key = f'tree_{col}'
+            if col not in plot_df.columns:
+                record[key] = np.nan
+            elif n_trees == 0:
+                # No trees at all - biomass is 0
+                record[key] = 0.0
+            elif n_live > 0 and live_valid[col].get(year, 0) == 0:
+                # Live trees exist but ALL have NaN biomass - can't estimate
+                record[key] = np.nan
+            elif np.isnan(tree_scale):
+                # No valid sampled area - can't calculate density
+                record[key] = np.nan
+            else:
+                record[key] = tree_sums[col][year] * tree_scale
+
+        record['n_trees'] = n_trees
+        if gap_counts is not None and year in gap_counts['n_filled']:
+            record['n_filled'] = int(gap_counts['n_filled'][year])
+            record['n_removed'] = int(gap_counts['n_removed'][year])
+            record['n_not_qualified'] = int(gap_counts['n_not_qualified'][year])
+        else:
+            record['n_filled'] = 0
+            record['n_removed'] = 0
+            record['n_not_qualified'] = 0
+
+        # Small woody biomass densities
+        n_sw_total = int(sw_n.get(year, 0))
+        for col in ALLOMETRY_COLS:
+            key = f'small_woody_{col}'
+            if col not in plot_df.columns:
+                record[key] = np.nan
+                continue
+            n_measured = int(sw_valid[col].get(year, 0))
+            if n_measured > 0:
+                # NaN scale covers the invalid-area case
+                record[key] = sw_sums[col][year] * sw_scale
+            else:
+                # No measured individuals
+                record[key] = 0.0 if n_sw_total == 0 else np.nan
+
+        record['n_small_woody_total'] = n_sw_total
+        record['n_small_woody_measured'] = (
+            int(sw_measured.get(year, 0)) if sw_measured is not None else 0
         )
-        results.append(year_result)
 
-    return pd.DataFrame(results)
+        results.append(record)
+
+    return results
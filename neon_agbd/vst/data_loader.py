@@ -2,6 +2,7 @@
 Data loading functions for NEON vegetation structure and NEONForestAGB datasets.
 """
 
+import functools
 import pickle
 import json
 import pandas as pd
@@ -9,6 +10,8 @@ import numpy as np
 from pathlib import Path
 from typing import Dict, Optional, Tuple
 
+from ..constants import ALLOMETRY_COLS
+
 
 def load_dp1_data(site_id: str, data_dir: str) -> Dict:
     """
@@ -39,12 +42,50 @@ def load_dp1_data(site_id: str, data_dir: str) -> Dict:
     with open(pkl_path, 'rb') as f:
         data = pickle.load(f)
 
+    # Convert the repeated low-cardinality string columns to Categorical once
+    # at load time: every downstream groupby/merge/isin then hashes small int
+    # codes instead of Python-object strings, and the columns shrink 5-10x.
+    # individualID is left as-is - it is high-cardinality and is used as a
+    # merge/grid key against frames built with plain object strings, where a
+    # categorical key would just be coerced back.
+    categorical_cols = ['plotID', 'siteID', 'eventID', 'growthForm', 'plantStatus']
+    for table in data.values():
+        if not isinstance(table, pd.DataFrame):
+            continue
+        for col in categorical_cols:
+            if col in table.columns and not isinstance(table[col].dtype, pd.CategoricalDtype):
+                table[col] = table[col].astype('category')
+        # Field measurements carry ~3 significant figures - float32 halves
+        # the working set and memory bandwidth of every downstream pass
+        for col in ['stemDiameter', 'height']:
+            if col in table.columns and table[col].dtype == np.float64:
+                table[col] = table[col].astype(np.float32)
+
     return data
 
 
+def _agb_cache_path(cache_dir: str, csv_files: list, site_id: Optional[str]) -> Path:
+    """
+    Build the Parquet cache path for a NEONForestAGB load.
+
+    The key hashes the source CSV names, sizes and mtimes, so editing or
+    re-downloading any part invalidates the cache automatically.
+    """
+    import hashlib
+
+    hasher = hashlib.md5()
+    for csv_file in csv_files:
+        stat = csv_file.stat()
+        hasher.update(f"{csv_file.name}:{stat.st_size}:{stat.st_mtime_ns};".encode())
+
+    site_tag = site_id if site_id is not None else 'ALL'
+    return Path(cache_dir) / f"NEONForestAGB_{site_tag}_{hasher.hexdigest()[:16]}.parquet"
+
+
 def load_neon_forest_agb(
     data_dir: str,
-    site_id: Optional[str] = None
+    site_id: Optional[str] = None,
+    cache_dir: Optional[str] = None
 ) -> pd.DataFrame:
     """
     Load and concatenate all NEONForestAGBv2 CSV files.
@@ -55,12 +96,25 @@ def load_neon_forest_agb(
         Absolute path to the directory containing the NEONForestAGB CSV files
     site_id : str, optional
         If provided, filter to only this site. If None, return all sites.
+    cache_dir : str, optional
+        If provided, memoize the loaded (site-filtered) frame as Parquet in
+        this directory, keyed on the CSV files' mtimes. Repeated runs - e.g.
+        compute_all_sites_biomass re-reading the same CSVs per site - then
+        skip the CSV parse entirely.
 
     Returns
     -------
     pd.DataFrame
         Concatenated dataframe with columns including:
         individualID, date, allometry, AGB, siteID, plotID, etc.
+
+    Notes
+    -----
+    When pyarrow is installed, the siteID filter is pushed down into the CSV
+    scan so only matching rows are ever materialized - the dataset covers all
+    ~40 sites, so this avoids parsing and holding the full concatenation to
+    extract one site. Without pyarrow we fall back to reading everything with
+    pandas and filtering afterwards.
     """
     data_path = Path(data_dir)
     csv_files = sorted(data_path.glob("NEONForestAGBv2_part*.csv"))
@@ -68,37 +122,82 @@ def load_neon_forest_agb(
     if not csv_files:
         raise FileNotFoundError(f"No NEONForestAGBv2 CSV files found in {data_dir}")
 
-    dfs = []
-    for csv_file in csv_files:
-        df = pd.read_csv(csv_file)
-        dfs.append(df)
-
-    combined_df = pd.concat(dfs, ignore_index=True)
-
-    if site_id is not None:
-        combined_df = combined_df[combined_df['siteID'] == site_id].copy()
-        if len(combined_df) == 0:
-            import warnings
-            warnings.warn(f"No NEONForestAGB data found for site {site_id}. "
-                         "This site may be non-forested (e.g., grassland).")
+    cache_path = None
+    if cache_dir is not None:
+        cache_path = _agb_cache_path(cache_dir, csv_files, site_id)
+        if cache_path.exists():
+            combined_df = pd.read_parquet(cache_path)
+            if site_id is not None and len(combined_df) == 0:
+                import warnings
+                warnings.warn(f"No NEONForestAGB data found for site {site_id}. "
+                             "This site may be non-forested (e.g., grassland).")
+            return combined_df
+
+    try:
+        import pyarrow.dataset as ds
+    except ImportError:
+        ds = None
+
+    if ds is not None:
+        dataset = ds.dataset([str(f) for f in csv_files], format='csv')
+        if site_id is not None:
+            table = dataset.to_table(filter=ds.field('siteID') == site_id)
+        else:
+            table = dataset.to_table()
+        combined_df = table.to_pandas()
+    else:
+        dfs = []
+        for csv_file in csv_files:
+            df = pd.read_csv(csv_file)
+            dfs.append(df)
+
+        combined_df = pd.concat(dfs, ignore_index=True)
+
+        if site_id is not None:
+            combined_df = combined_df[combined_df['siteID'] == site_id].copy()
+
+    if cache_path is not None:
+        # Best-effort: a failed cache write (no pyarrow/fastparquet, read-only
+        # dir) should never break the load itself
+        try:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            combined_df.to_parquet(cache_path, compression='zstd')
+        except Exception:
+            pass
+
+    if site_id is not None and len(combined_df) == 0:
+        import warnings
+        warnings.warn(f"No NEONForestAGB data found for site {site_id}. "
+                     "This site may be non-forested (e.g., grassland).")
 
     return combined_df
 
 
-def load_plot_areas(geojson_path: str) -> pd.DataFrame:
+@functools.lru_cache(maxsize=4)
+def _load_plot_areas_cached(geojson_path: str) -> pd.DataFrame:
     """
-    Load plot area information from the NEON TOS Plot Polygons GeoJSON file.
+    Parse the plot polygons GeoJSON, memoized on the path.
 
-    Parameters
-    ----------
-    geojson_path : str
-        Absolute path to the GeoJSON file containing plot polygons
-
-    Returns
-    -------
-    pd.DataFrame
-        DataFrame with plotID, plotSize (m²), and siteID columns
+    Internal: callers must not mutate the returned frame - it is the cached
+    object itself. load_plot_areas hands out a copy.
     """
+    attr_cols = ['plotID', 'plotSize', 'siteID', 'plotType']
+
+    try:
+        import pyogrio
+    except ImportError:
+        pyogrio = None
+
+    if pyogrio is not None:
+        gdf = pyogrio.read_dataframe(geojson_path, columns=attr_cols,
+                                     read_geometry=False)
+        df = pd.DataFrame(gdf)
+        # Keep the legacy column set/order; anything missing comes back NaN
+        for col in attr_cols:
+            if col not in df.columns:
+                df[col] = np.nan
+        return df[attr_cols]
+
     with open(geojson_path, 'r') as f:
         data = json.load(f)
 
@@ -115,6 +214,34 @@ def load_plot_areas(geojson_path: str) -> pd.DataFrame:
     return pd.DataFrame(records)
 
 
+def load_plot_areas(geojson_path: str) -> pd.DataFrame:
+    """
+    Load plot area information from the NEON TOS Plot Polygons GeoJSON file.
+
+    The parse is memoized on the path, so a multi-site run reads the
+    (site-independent) GeoJSON once instead of once per site. Each call
+    returns a fresh copy - callers can mutate their result freely without
+    affecting later calls.
+
+    Parameters
+    ----------
+    geojson_path : str
+        Absolute path to the GeoJSON file containing plot polygons
+
+    Returns
+    -------
+    pd.DataFrame
+        DataFrame with plotID, plotSize (m²), and siteID columns
+
+    Notes
+    -----
+    When pyogrio is installed, the attributes are read straight into a
+    DataFrame in C (geometry skipped entirely), which is typically an order
+    of magnitude faster than json.load plus a Python loop over features.
+    """
+    return _load_plot_areas_cached(geojson_path).copy()
+
+
 def pivot_agb_by_allometry(agb_df: pd.DataFrame) -> pd.DataFrame:
     """
     Pivot the NEONForestAGB dataframe so each allometry type becomes a column.
@@ -135,20 +262,44 @@ def pivot_agb_by_allometry(agb_df: pd.DataFrame) -> pd.DataFrame:
         Pivoted dataframe with individualID, date as index columns
         and AGBJenkins, AGBChojnacky, AGBAnnighofer as value columns
     """
-    # Select only the columns we need for pivoting
-    pivot_df = agb_df[['individualID', 'date', 'allometry', 'AGB']].copy()
+    # Select only the columns we need for pivoting. Deduplicate up front so
+    # we can use the plain reshape pivot() instead of pivot_table, which
+    # always runs a full groupby-aggregate even when no aggregation is
+    # needed. aggfunc='first' took the first non-NaN value per duplicate
+    # group, so drop NaN AGB rows before keeping the first duplicate - a
+    # group with only NaN values still comes out NaN after the left-merge.
+    pivot_df = (
+        agb_df[['individualID', 'date', 'allometry', 'AGB']]
+        .dropna(subset=['AGB'])
+        .drop_duplicates(['individualID', 'date', 'allometry'], keep='first')
+    )
+
+    # Fixed categories keep the output column order deterministic and the
+    # internal hashmap tiny; unknown allometry names (none expected) are
+    # appended after the known three
+    categories = list(ALLOMETRY_COLS) + [
+        v for v in pivot_df['allometry'].unique() if v not in ALLOMETRY_COLS
+    ]
+    pivot_df = pivot_df.assign(
+        allometry=pd.Categorical(pivot_df['allometry'], categories=categories)
+    )
 
     # Pivot the dataframe
-    pivoted = pivot_df.pivot_table(
+    pivoted = pivot_df.pivot(
         index=['individualID', 'date'],
         columns='allometry',
-        values='AGB',
-        aggfunc='first'  # Take first value if duplicates exist
+        values='AGB'
     ).reset_index()
 
     # Flatten column names
     pivoted.columns.name = None
 
+    # AGB estimates carry ~3 significant figures; float32 halves the memory
+    # and bandwidth of the merge and every downstream sum
+    for col in ALLOMETRY_COLS:
+        if col in pivoted.columns and pivoted[col].dtype == np.float64:
+            pivoted[col] = pivoted[col].astype(np.float32)
+
     return pivoted
 
 
@@ -173,25 +324,30 @@ def merge_agb_with_apparent_individual(
         the three allometry AGB columns. Rows without matching AGB data
         will have NA values for the AGB columns.
     """
-    # Ensure date columns are in the same format
-    vst_ai = vst_ai.copy()
-    agb_pivoted = agb_pivoted.copy()
-
-    # Convert dates to string format YYYY-MM-DD for consistent merging
-    vst_ai['date_str'] = pd.to_datetime(vst_ai['date']).dt.strftime('%Y-%m-%d')
-    agb_pivoted['date_str'] = pd.to_datetime(agb_pivoted['date']).dt.strftime('%Y-%m-%d')
+    # Normalize both date columns to integer days since epoch. This joins on
+    # day precision like the previous YYYY-MM-DD string key, but int keys
+    # hash far faster than Python-object strings and halve the merge
+    # working set. assign() leaves the inputs untouched and shares their
+    # column blocks instead of deep-copying both frames.
+    vst_ai = vst_ai.assign(
+        _date_days=pd.to_datetime(vst_ai['date']).values.astype('datetime64[D]').astype(np.int32)
+    )
+    agb_pivoted = agb_pivoted.assign(
+        _date_days=pd.to_datetime(agb_pivoted['date']).values.astype('datetime64[D]').astype(np.int32)
+    )
 
     # Determine which allometry columns are available
     allometry_cols = ['AGBJenkins', 'AGBChojnacky', 'AGBAnnighofer']
     available_cols = [c for c in allometry_cols if c in agb_pivoted.columns]
-    merge_cols = ['individualID', 'date_str'] + available_cols
+    merge_cols = ['individualID', '_date_days'] + available_cols
 
-    # Merge on individualID and date
+    # Merge on individualID and date; the pivoted AGB table is unique per
+    # (individualID, date), so validate catches accidental fan-outs
     merged = vst_ai.merge(
         agb_pivoted[merge_cols],
-        left_on=['individualID', 'date_str'],
-        right_on=['individualID', 'date_str'],
-        how='left'
+        on=['individualID', '_date_days'],
+        how='left',
+        validate='m:1'
     )
 
     # Add missing allometry columns as NaN
@@ -199,8 +355,8 @@ def merge_agb_with_apparent_individual(
         if col not in merged.columns:
             merged[col] = np.nan
 
-    # Drop the temporary date_str column
-    merged = merged.drop(columns=['date_str'])
+    # Drop the temporary merge-key column
+    merged = merged.drop(columns=['_date_days'])
 
     return merged
 
@@ -224,6 +380,24 @@ def extract_year_from_event_id(event_id: str) -> int:
     return int(event_id[-4:])
 
 
+def extract_years_from_event_ids(event_ids: pd.Series) -> pd.Series:
+    """
+    Vectorized counterpart of extract_year_from_event_id for a whole column.
+
+    Parameters
+    ----------
+    event_ids : pd.Series
+        Series of eventID strings ('vst_SITE_YYYY')
+
+    Returns
+    -------
+    pd.Series
+        Years as int16 (survey years fit comfortably; the narrow dtype
+        shrinks the column and downstream groupby keys)
+    """
+    return event_ids.str[-4:].astype(np.int16)
+
+
 def get_unique_plot_years(vst_ai: pd.DataFrame) -> pd.DataFrame:
     """
     Get all unique combinations of plotID and year from the vst_apparentindividual table.
@@ -238,8 +412,7 @@ def get_unique_plot_years(vst_ai: pd.DataFrame) -> pd.DataFrame:
     pd.DataFrame
         DataFrame with columns plotID and year
     """
-    df = vst_ai.copy()
-    df['year'] = df['eventID'].apply(extract_year_from_event_id)
+    df = vst_ai.assign(year=extract_years_from_event_ids(vst_ai['eventID']))
 
     unique_combinations = df[['plotID', 'year']].drop_duplicates().sort_values(['plotID', 'year'])
 
@@ -264,8 +437,7 @@ def get_plot_years_from_perplotperyear(vst_ppy: pd.DataFrame) -> pd.DataFrame:
         DataFrame with columns: plotID, year, totalSampledAreaTrees,
         totalSampledAreaShrubSapling, treesPresent, shrubsPresent
     """
-    df = vst_ppy.copy()
-    df['year'] = df['eventID'].apply(extract_year_from_event_id)
+    df = vst_ppy.assign(year=extract_years_from_event_ids(vst_ppy['eventID']))
 
     # Select relevant columns
     cols_to_keep = ['plotID', 'year', 'totalSampledAreaTrees',
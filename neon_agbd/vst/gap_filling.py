@@ -6,9 +6,9 @@ Also handles dead status corrections and related data cleaning.
 import numpy as np
 import pandas as pd
 from typing import List, Optional, Tuple
-from scipy import stats
 
-from ..constants import DEAD_STATUSES, LIVE_STATUSES, REMOVED_STATUSES, ALLOMETRY_COLS
+from ..constants import (DEAD_STATUSES, LIVE_STATUSES, REMOVED_STATUSES,
+                         ALLOMETRY_COLS, GAP_FILLING_DTYPE)
 
 
 def is_dead_status(status: str) -> bool:
@@ -87,6 +87,83 @@ def is_not_qualified_status(status: str) -> bool:
     return status == 'No longer qualifies'
 
 
+def _status_isin(status: pd.Series, statuses: frozenset) -> np.ndarray:
+    """
+    Vectorized membership test for a plantStatus column.
+
+    For Categorical columns (the normal case since load_dp1_data converts
+    them), the membership test runs once over the handful of categories and
+    rows are resolved through their int codes - no per-row string hashing.
+    NaN (code -1) maps to False, matching the scalar helpers.
+
+    Parameters
+    ----------
+    status : pd.Series
+        plantStatus column (Categorical or plain strings)
+    statuses : frozenset
+        Status strings to test membership against
+
+    Returns
+    -------
+    np.ndarray
+        Boolean mask over the rows
+    """
+    if isinstance(status.dtype, pd.CategoricalDtype):
+        category_mask = np.asarray(status.cat.categories.isin(list(statuses)))
+        codes = status.cat.codes.to_numpy()
+        result = np.zeros(len(codes), dtype=bool)
+        observed = codes >= 0
+        result[observed] = category_mask[codes[observed]]
+        return result
+    return status.isin(statuses).to_numpy()
+
+
+def _yearly_status_flags(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Compute yearly status flags for every individual in one grouped pass.
+
+    Vectorized core shared by get_individual_status_by_year and
+    apply_dead_status_corrections: the per-status membership tests run over
+    the whole plantStatus column, and a single groupby-any collapses stems
+    to individual-years.
+
+    Parameters
+    ----------
+    df : pd.DataFrame
+        DataFrame with 'individualID', 'year' and 'plantStatus' columns
+
+    Returns
+    -------
+    pd.DataFrame
+        One row per (individualID, year) with columns ['individualID',
+        'year', 'is_dead', 'is_removed', 'is_not_qualified',
+        'has_status_observation'], sorted by individual and year.
+    """
+    status = df['plantStatus']
+    stem_flags = pd.DataFrame({
+        'has_live': _status_isin(status, LIVE_STATUSES),
+        'has_dead': _status_isin(status, DEAD_STATUSES),
+        'has_removed': _status_isin(status, frozenset({'Removed'})),
+        'has_not_qualified': _status_isin(status, frozenset({'No longer qualifies'})),
+        'has_status_observation': status.notna().to_numpy(),
+    }, index=df.index)
+
+    grouped = stem_flags.groupby([df['individualID'], df['year']]).any()
+    grouped.index.names = ['individualID', 'year']
+    yearly = grouped.reset_index()
+
+    # Only dead if no live stems and at least one dead stem
+    yearly['is_dead'] = ~yearly['has_live'] & yearly['has_dead']
+    # Removed/not-qualified take precedence if present (even with live stems)
+    # because these indicate the tree is no longer being tracked;
+    # removed takes precedence over not-qualified
+    yearly['is_removed'] = yearly['has_removed']
+    yearly['is_not_qualified'] = yearly['has_not_qualified'] & ~yearly['has_removed']
+
+    return yearly[['individualID', 'year', 'is_dead', 'is_removed',
+                   'is_not_qualified', 'has_status_observation']]
+
+
 def get_individual_status_by_year(df: pd.DataFrame, individual_id: str) -> pd.DataFrame:
     """
     Get the overall status for an individual by year.
@@ -109,43 +186,13 @@ def get_individual_status_by_year(df: pd.DataFrame, individual_id: str) -> pd.Da
         'has_status_observation' is True if at least one plantStatus value was
         recorded (not NaN) for that year.
     """
-    ind_df = df[df['individualID'] == individual_id].copy()
+    ind_df = df[df['individualID'] == individual_id]
 
     if ind_df.empty:
         return pd.DataFrame(columns=['individualID', 'year', 'is_dead', 'is_removed',
                                       'is_not_qualified', 'has_status_observation'])
 
-    # Group by year and check status
-    results = []
-    for year in ind_df['year'].unique():
-        year_df = ind_df[ind_df['year'] == year]
-        statuses = year_df['plantStatus'].unique()
-        has_live = any(is_live_status(s) for s in statuses)
-        has_dead = any(is_dead_status(s) for s in statuses)
-        has_removed = any(is_removed_status(s) for s in statuses)
-        has_not_qualified = any(is_not_qualified_status(s) for s in statuses)
-        # Check if any plantStatus was actually recorded (not all NaN)
-        has_status_observation = any(pd.notna(s) for s in statuses)
-        # Only dead if no live stems and at least one dead stem
-        is_dead = not has_live and has_dead
-        # Removed/not-qualified take precedence if present (even with live stems)
-        # because these indicate the tree is no longer being tracked
-        is_removed = has_removed
-        is_not_qualified = has_not_qualified and not has_removed  # removed takes precedence
-        results.append({
-            'year': year,
-            'is_dead': is_dead,
-            'is_removed': is_removed,
-            'is_not_qualified': is_not_qualified,
-            'has_status_observation': has_status_observation
-        })
-
-    yearly_status = pd.DataFrame(results)
-    yearly_status['individualID'] = individual_id
-    yearly_status = yearly_status[['individualID', 'year', 'is_dead', 'is_removed',
-                                    'is_not_qualified', 'has_status_observation']].sort_values('year')
-
-    return yearly_status
+    return _yearly_status_flags(ind_df).sort_values('year')
 
 
 def correct_sandwiched_dead_status(yearly_status: pd.DataFrame) -> pd.DataFrame:
@@ -170,8 +217,8 @@ def correct_sandwiched_dead_status(yearly_status: pd.DataFrame) -> pd.DataFrame:
     pd.DataFrame
         Corrected DataFrame with same columns, plus 'corrected_is_dead'
     """
-    df = yearly_status.copy()
-    df = df.sort_values('year').reset_index(drop=True)
+    # sort_values + reset_index already yields a new frame; no copy needed
+    df = yearly_status.sort_values('year').reset_index(drop=True)
 
     # Initialize corrected status as original
     df['corrected_is_dead'] = df['is_dead'].copy()
@@ -179,35 +226,26 @@ def correct_sandwiched_dead_status(yearly_status: pd.DataFrame) -> pd.DataFrame:
     if len(df) < 3:
         return df
 
-    # Check if has_status_observation column exists
-    has_obs_col = 'has_status_observation' in df.columns
+    # Restrict to years with actual observations: "nearest observed
+    # neighbour" then becomes simply the previous/next element of that
+    # subsequence, so the whole scan reduces to a 3-tap shifted AND.
+    if 'has_status_observation' in df.columns:
+        observed_idx = np.flatnonzero(df['has_status_observation'].to_numpy(dtype=bool))
+    else:
+        observed_idx = np.arange(len(df))
 
-    # Look for sandwiched dead status
-    for i in range(1, len(df) - 1):
-        if df.loc[i, 'is_dead']:  # Current year is dead
-            # Only correct if the dead year has an actual observation
-            if has_obs_col and not df.loc[i, 'has_status_observation']:
-                continue
+    if observed_idx.size < 3:
+        return df
+
+    dead = df['is_dead'].to_numpy(dtype=bool)[observed_idx]
+    alive = ~dead
 
-            # Find the nearest previous year with an actual observation
-            prev_alive = False
-            for j in range(i - 1, -1, -1):
-                if has_obs_col and not df.loc[j, 'has_status_observation']:
-                    continue  # Skip gap-filled years
-                prev_alive = not df.loc[j, 'is_dead']
-                break
-
-            # Find the nearest next year with an actual observation
-            next_alive = False
-            for j in range(i + 1, len(df)):
-                if has_obs_col and not df.loc[j, 'has_status_observation']:
-                    continue  # Skip gap-filled years
-                next_alive = not df.loc[j, 'is_dead']
-                break
-
-            if prev_alive and next_alive:
-                # Sandwiched dead - correct to alive
-                df.loc[i, 'corrected_is_dead'] = False
+    # Dead with an alive observation on both sides - the first and last
+    # observed years have no neighbour on one side and stay uncorrected
+    sandwiched = np.zeros(observed_idx.size, dtype=bool)
+    sandwiched[1:-1] = dead[1:-1] & alive[:-2] & alive[2:]
+
+    df.loc[observed_idx[sandwiched], 'corrected_is_dead'] = False
 
     return df
 
@@ -234,8 +272,8 @@ def forward_fill_dead_status(yearly_status: pd.DataFrame) -> pd.DataFrame:
     pd.DataFrame
         DataFrame with corrected_is_dead updated to forward-fill dead status
     """
-    df = yearly_status.copy()
-    df = df.sort_values('year').reset_index(drop=True)
+    # sort_values + reset_index already yields a new frame; no copy needed
+    df = yearly_status.sort_values('year').reset_index(drop=True)
 
     # Find the first year where the tree is dead (after sandwiched correction)
     first_dead_idx = None
@@ -272,8 +310,8 @@ def back_fill_dead_status(yearly_status: pd.DataFrame) -> pd.DataFrame:
     pd.DataFrame
         DataFrame with corrected_is_dead updated to back-fill dead status
     """
-    df = yearly_status.copy()
-    df = df.sort_values('year').reset_index(drop=True)
+    # sort_values + reset_index already yields a new frame; no copy needed
+    df = yearly_status.sort_values('year').reset_index(drop=True)
 
     if 'has_status_observation' not in df.columns:
         return df
@@ -307,8 +345,8 @@ def forward_fill_removed_status(yearly_status: pd.DataFrame) -> pd.DataFrame:
     pd.DataFrame
         DataFrame with 'corrected_is_removed' column added
     """
-    df = yearly_status.copy()
-    df = df.sort_values('year').reset_index(drop=True)
+    # sort_values + reset_index already yields a new frame; no copy needed
+    df = yearly_status.sort_values('year').reset_index(drop=True)
 
     # Initialize corrected status
     df['corrected_is_removed'] = df['is_removed'].copy() if 'is_removed' in df.columns else False
@@ -341,8 +379,8 @@ def forward_fill_not_qualified_status(yearly_status: pd.DataFrame) -> pd.DataFra
     pd.DataFrame
         DataFrame with 'corrected_is_not_qualified' column added
     """
-    df = yearly_status.copy()
-    df = df.sort_values('year').reset_index(drop=True)
+    # sort_values + reset_index already yields a new frame; no copy needed
+    df = yearly_status.sort_values('year').reset_index(drop=True)
 
     # Initialize corrected status
     df['corrected_is_not_qualified'] = df['is_not_qualified'].copy() if 'is_not_qualified' in df.columns else False
@@ -391,26 +429,20 @@ def apply_dead_status_corrections(df: pd.DataFrame) -> pd.DataFrame:
         DataFrame with added 'corrected_is_dead', 'corrected_is_removed',
         and 'corrected_is_not_qualified' columns
     """
-    df = df.copy()
-
     if 'year' not in df.columns or 'plantStatus' not in df.columns:
-        df['corrected_is_dead'] = False
-        df['corrected_is_removed'] = False
-        df['corrected_is_not_qualified'] = False
-        return df
+        return df.assign(corrected_is_dead=False,
+                         corrected_is_removed=False,
+                         corrected_is_not_qualified=False)
 
-    # Get unique individuals
-    individuals = df['individualID'].unique()
+    # Yearly status flags for every individual in one vectorized pass, then
+    # the sequential per-individual corrections run over that small table
+    all_yearly_status = _yearly_status_flags(df)
 
-    # Build mappings of (individualID, year) -> corrected status
-    dead_corrections = {}
-    removed_corrections = {}
-    not_qualified_corrections = {}
+    # Run the sequential per-individual corrections, collecting the corrected
+    # tables instead of scattering rows into Python dicts via iterrows
+    corrected_frames = []
 
-    for ind_id in individuals:
-        yearly_status = get_individual_status_by_year(df, ind_id)
-        if yearly_status.empty:
-            continue
+    for ind_id, yearly_status in all_yearly_status.groupby('individualID', sort=False):
 
         # Step 1: Correct sandwiched dead statuses (alive->dead->alive)
         corrected = correct_sandwiched_dead_status(yearly_status)
@@ -427,27 +459,36 @@ def apply_dead_status_corrections(df: pd.DataFrame) -> pd.DataFrame:
         # Step 5: Forward-fill not-qualified status
         corrected = forward_fill_not_qualified_status(corrected)
 
-        for _, row in corrected.iterrows():
-            key = (row['individualID'], row['year'])
-            dead_corrections[key] = row['corrected_is_dead']
-            removed_corrections[key] = row.get('corrected_is_removed', False)
-            not_qualified_corrections[key] = row.get('corrected_is_not_qualified', False)
+        corrected_frames.append(corrected)
 
-    # Apply corrections to dataframe
-    df['corrected_is_dead'] = df.apply(
-        lambda row: dead_corrections.get((row['individualID'], row['year']), False),
-        axis=1
-    )
-    df['corrected_is_removed'] = df.apply(
-        lambda row: removed_corrections.get((row['individualID'], row['year']), False),
-        axis=1
-    )
-    df['corrected_is_not_qualified'] = df.apply(
-        lambda row: not_qualified_corrections.get((row['individualID'], row['year']), False),
-        axis=1
+    # Apply corrections to dataframe through one pre-indexed table and a
+    # vectorized (individualID, year) reindex per status
+    row_keys = pd.MultiIndex.from_arrays(
+        [df['individualID'].to_numpy(), np.asarray(df['year'], dtype=np.int64)]
     )
 
-    return df
+    if corrected_frames:
+        all_corrected = pd.concat(corrected_frames, ignore_index=True)
+        all_corrected = all_corrected.set_index(pd.MultiIndex.from_arrays([
+            all_corrected['individualID'].to_numpy(),
+            np.asarray(all_corrected['year'], dtype=np.int64),
+        ]))
+    else:
+        all_corrected = None
+
+    def _lookup(status_col: str) -> np.ndarray:
+        if all_corrected is None or status_col not in all_corrected.columns:
+            return np.zeros(len(df), dtype=bool)
+        return (
+            all_corrected[status_col]
+            .reindex(row_keys).fillna(False).to_numpy(dtype=bool)
+        )
+
+    return df.assign(
+        corrected_is_dead=_lookup('corrected_is_dead'),
+        corrected_is_removed=_lookup('corrected_is_removed'),
+        corrected_is_not_qualified=_lookup('corrected_is_not_qualified'),
+    )
 
 
 def zero_biomass_for_dead_trees(df: pd.DataFrame, allometry_cols: List[str]) -> pd.DataFrame:
@@ -472,10 +513,11 @@ def zero_biomass_for_dead_trees(df: pd.DataFrame, allometry_cols: List[str]) ->
     Returns
     -------
     pd.DataFrame
-        DataFrame with zeroed biomass and updated gapFilling for affected trees
+        DataFrame with zeroed biomass and updated gapFilling for affected
+        trees. The writes go through masked assignment on the input frame;
+        under copy-on-write only the touched columns are reallocated, and
+        other frames sharing those blocks are unaffected.
     """
-    df = df.copy()
-
     # Zero out biomass for dead trees
     if 'corrected_is_dead' in df.columns:
         dead_mask = df['corrected_is_dead'] == True
@@ -547,10 +589,28 @@ def fit_linear_model(years: np.ndarray, values: np.ndarray) -> Tuple[float, floa
     Returns
     -------
     Tuple[float, float]
-        Slope and intercept of the linear fit
+        Slope and intercept of the linear fit, or (NaN, NaN) if the years
+        have no variation
     """
-    slope, intercept, _, _, _ = stats.linregress(years, values)
-    return slope, intercept
+    # Closed-form OLS in numpy: stats.linregress also computes r/p/stderr,
+    # which dominates the cost for the 2-10 point series we fit per
+    # individual
+    x = np.asarray(years, dtype=np.float64)
+    y = np.asarray(values, dtype=np.float64)
+
+    x_mean = x.mean()
+    y_mean = y.mean()
+    dx = x - x_mean
+    denom = (dx * dx).sum()
+    if denom == 0:
+        # No variation in years (callers guard against this)
+        return np.nan, np.nan
+
+    slope = (dx * (y - y_mean)).sum() / denom
+    intercept = y_mean - slope * x_mean
+    # Plain Python floats: downstream per-year arithmetic on numpy scalars
+    # pays a boxing cost per operation
+    return float(slope), float(intercept)
 
 
 def predict_from_linear(year: int, slope: float, intercept: float) -> float:
@@ -601,16 +661,21 @@ def gap_fill_individual_allometry(
     Returns
     -------
     pd.DataFrame
-        DataFrame with gap-filled values in the allometry column
+        DataFrame with gap-filled values in the allometry column. The input
+        frame is filled in place (callers in this module always pass a
+        per-individual copy) and returned.
     """
-    df = df.copy()
-
     # Get valid (non-NA) observations
     valid_mask = df[allometry_col].notna()
     valid_df = df[valid_mask]
 
     n_valid = len(valid_df)
 
+    if n_valid == len(df):
+        # Every year already observed - common for individuals sampled in
+        # each campaign - so skip the fill machinery entirely
+        return df
+
     if n_valid == 0:
         # No observations, leave all as NA
         return df
@@ -631,14 +696,34 @@ def gap_fill_individual_allometry(
             # All observations are from the same year, use mean value
             fill_value = np.mean(values)
             df[allometry_col] = df[allometry_col].fillna(fill_value)
+        elif n_valid == 2:
+            # Two observations: the OLS line passes exactly through both
+            # points, so compute it directly - no sums, no centering
+            x0, x1 = float(years[0]), float(years[1])
+            y0, y1 = float(values[0]), float(values[1])
+            slope = (y1 - y0) / (x1 - x0)
+            intercept = y0 - slope * x0
+
+            missing_mask = df[allometry_col].isna()
+            years_missing = df.loc[missing_mask, 'year'].to_numpy(dtype=np.float64)
+            predictions = slope * years_missing + intercept
+            np.maximum(predictions, 0.0, out=predictions)
+            df.loc[missing_mask, allometry_col] = predictions.astype(
+                df[allometry_col].dtype, copy=False
+            )
         else:
             slope, intercept = fit_linear_model(years, values)
 
-            # Fill missing values
+            # Fill all missing years with one vectorized predict + clip
+            # (biomass can't be negative), cast to the column dtype -
+            # float32 columns reject lossy float64 assignment
             missing_mask = df[allometry_col].isna()
-            for idx in df[missing_mask].index:
-                year = df.loc[idx, 'year']
-                df.loc[idx, allometry_col] = predict_from_linear(year, slope, intercept)
+            years_missing = df.loc[missing_mask, 'year'].to_numpy(dtype=np.float64)
+            predictions = slope * years_missing + intercept
+            np.maximum(predictions, 0.0, out=predictions)
+            df.loc[missing_mask, allometry_col] = predictions.astype(
+                df[allometry_col].dtype, copy=False
+            )
 
     return df
 
@@ -694,18 +779,70 @@ def gap_fill_plot_data(
     -------
     pd.DataFrame
         DataFrame with gap-filled values for all individuals
+
+    Notes
+    -----
+    Implements the same per-individual rules as gap_fill_individual_allometry
+    (linear fit for 2+ observations across distinct years, mean for repeated
+    same-year observations, constant for a single observation, NA untouched),
+    but computes every individual's fit in one set of grouped transforms
+    instead of slicing and re-fitting per individual in Python.
     """
     if df.empty:
         return df
 
-    result_dfs = []
+    present_cols = [c for c in allometry_cols if c in df.columns]
+    if not present_cols:
+        return df
 
-    for individual_id in df['individualID'].unique():
-        individual_df = df[df['individualID'] == individual_id].copy()
-        filled_df = gap_fill_all_allometries(individual_df, individual_id, allometry_cols)
-        result_dfs.append(filled_df)
+    df = df.copy()
 
-    return pd.concat(result_dfs, ignore_index=True)
+    values = df[present_cols].astype(np.float64)
+    valid = values.notna()
+    missing = ~valid
+    if not missing.to_numpy().any():
+        return df
+
+    group_keys = df['individualID']
+    years = df['year'].astype(np.float64)
+
+    # Observed (x, y) pairs per column; NaNs drop out of the grouped sums.
+    # All three allometry columns share each grouped pass, so the grouping
+    # cost is paid once instead of per column.
+    x = pd.DataFrame({c: years.where(valid[c]) for c in present_cols},
+                     index=df.index)
+    y = values.where(valid)
+
+    n_valid = valid.groupby(group_keys).transform('sum')
+    n_years = x.groupby(group_keys).transform('nunique')
+    x_mean = x.groupby(group_keys).transform('mean')
+    y_mean = y.groupby(group_keys).transform('mean')
+
+    # Mean-centered OLS per group and column, broadcast back to rows
+    dx = x - x_mean
+    denom = (dx * dx).groupby(group_keys).transform('sum')
+    numer = (dx * (y - y_mean)).groupby(group_keys).transform('sum')
+    with np.errstate(invalid='ignore', divide='ignore'):
+        slope = numer / denom
+    intercept = y_mean - slope * x_mean
+    predictions = slope.mul(years, axis=0).add(intercept).clip(lower=0.0)
+
+    fill = pd.DataFrame(np.nan, index=df.index, columns=present_cols)
+    # Exactly one observation: constant fill with that value (== the mean)
+    fill = fill.mask(n_valid == 1, y_mean)
+    # 2+ observations but all in the same year: fill with the mean
+    fill = fill.mask((n_valid >= 2) & (n_years < 2), y_mean)
+    # 2+ observations across distinct years: linear predict, clipped at 0
+    fill = fill.mask((n_valid >= 2) & (n_years >= 2), predictions)
+
+    # Individuals with no observations keep NaN
+    for col in present_cols:
+        fill_mask = missing[col] & fill[col].notna()
+        df.loc[fill_mask, col] = fill.loc[fill_mask, col].astype(
+            df[col].dtype, copy=False
+        )
+
+    return df
 
 
 def create_complete_individual_year_grid(
@@ -743,29 +880,36 @@ def create_complete_individual_year_grid(
     # Get all unique individuals in this plot
     individuals = df['individualID'].unique()
 
-    # Create complete grid
-    grid = pd.DataFrame([
-        {'individualID': ind, 'year': year, 'plotID': plot_id}
-        for ind in individuals
-        for year in years
-    ])
+    # Create complete grid: the individual x year product built directly as
+    # arrays instead of a nested list of per-row dicts
+    grid = pd.MultiIndex.from_product(
+        [individuals, years], names=['individualID', 'year']
+    ).to_frame(index=False)
+    grid['plotID'] = plot_id
 
     # Get columns to keep from original df (excluding those we're creating)
     value_columns = [c for c in df.columns if c not in ['individualID', 'year', 'plotID']]
 
     # Mark original data
-    df_with_flag = df.copy()
-    df_with_flag['gapFilling'] = 'ORIGINAL'
-
-    # Merge original data onto grid
-    merged = grid.merge(
-        df_with_flag[['individualID', 'year', 'gapFilling'] + value_columns],
-        on=['individualID', 'year'],
-        how='left'
+    df_with_flag = df.assign(gapFilling='ORIGINAL')
+
+    # Align original data onto the grid through the (individualID, year)
+    # index: join skips merge's key-column re-hashing on the left side and
+    # still fans out multi-stem rows (duplicate right index) like the old
+    # column merge did
+    merged = (
+        grid.set_index(['individualID', 'year'])
+        .join(
+            df_with_flag[['individualID', 'year', 'gapFilling'] + value_columns]
+            .set_index(['individualID', 'year']),
+            how='left'
+        )
+        .reset_index()
     )
 
-    # Mark gap-filled rows
-    merged['gapFilling'] = merged['gapFilling'].fillna('FILLED')
+    # Mark gap-filled rows; the provenance column is dictionary-encoded so
+    # the many downstream equality tests compare int8 codes, not strings
+    merged['gapFilling'] = merged['gapFilling'].fillna('FILLED').astype(GAP_FILLING_DTYPE)
 
     return merged
 
@@ -792,13 +936,13 @@ def forward_fill_growth_form(df: pd.DataFrame) -> pd.DataFrame:
     Returns
     -------
     pd.DataFrame
-        DataFrame with growthForm and stemDiameter filled for gap-filled rows
+        DataFrame with growthForm and stemDiameter filled for gap-filled
+        rows. Writes use masked assignment on the input frame; under
+        copy-on-write only the touched columns are reallocated.
     """
     if df.empty:
         return df
 
-    df = df.copy()
-
     columns_to_fill = ['growthForm', 'stemDiameter']
     columns_present = [c for c in columns_to_fill if c in df.columns]
 
@@ -808,35 +952,32 @@ def forward_fill_growth_form(df: pd.DataFrame) -> pd.DataFrame:
     # Check if gapFilling column exists
     has_gap_filling = 'gapFilling' in df.columns
 
-    # Replace empty strings with NaN so they can be filled
+    # Replace empty strings with NaN so they can be filled (plain string
+    # columns only; the Categorical growthForm from load_dp1_data has no
+    # empty-string category to begin with)
     for col in columns_present:
-        if df[col].dtype == object:  # String column
+        if pd.api.types.is_object_dtype(df[col]) or pd.api.types.is_string_dtype(df[col]):
             df[col] = df[col].replace('', np.nan)
 
-    # Opt-in to future pandas behavior to avoid FutureWarning
-    with pd.option_context('future.no_silent_downcasting', True):
-        # Process each individual separately
-        for ind_id in df['individualID'].unique():
-            ind_mask = df['individualID'] == ind_id
-            ind_df = df.loc[ind_mask].sort_values('year')
-
-            for col in columns_present:
-                # Get indices of FILLED rows only (these are the ones we want to fill)
-                if has_gap_filling:
-                    filled_row_mask = ind_df['gapFilling'] == 'FILLED'
-                else:
-                    # If no gapFilling column, fill all NaN values (legacy behavior)
-                    filled_row_mask = ind_df[col].isna()
-
-                if not filled_row_mask.any():
-                    continue
-
-                # Compute forward-filled and back-filled values for the whole series
-                filled_values = ind_df[col].ffill().bfill()
-
-                # Only apply to FILLED rows
-                filled_indices = ind_df[filled_row_mask].index
-                df.loc[filled_indices, col] = filled_values.loc[filled_indices].values
+    # Compute the forward+backward filled series for every individual with
+    # two grouped Cython passes over a year-sorted view; index alignment
+    # brings the values back to the original row order
+    sorted_df = df.sort_values(['individualID', 'year'])
+    for col in columns_present:
+        filled_values = sorted_df.groupby('individualID', sort=False)[col].ffill()
+        filled_values = filled_values.groupby(
+            sorted_df['individualID'], sort=False
+        ).bfill()
+
+        # Only apply to FILLED rows (legacy behavior without a gapFilling
+        # column: fill all NaN values)
+        if has_gap_filling:
+            filled_row_mask = df['gapFilling'] == 'FILLED'
+        else:
+            filled_row_mask = df[col].isna()
+
+        if filled_row_mask.any():
+            df.loc[filled_row_mask, col] = filled_values
 
     return df
 